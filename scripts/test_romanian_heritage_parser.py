@@ -0,0 +1,49 @@
+"""
+Regression tests for the LIDO parser of romanian_heritage_parser.py.
+
+Run with: python -m pytest scripts
+"""
+
+from pathlib import Path
+
+import pytest
+
+from romanian_heritage_parser import LIDOParser
+
+RECORD = (
+    "<lido:lido><lido:lidoRecID>ro-{0:04d}</lido:lidoRecID>"
+    "<lido:descriptiveMetadata><lido:objectIdentificationWrap><lido:titleWrap>"
+    "<lido:titleSet><lido:appellationValue>Peisaj {0}</lido:appellationValue>"
+    "</lido:titleSet></lido:titleWrap></lido:objectIdentificationWrap>"
+    "</lido:descriptiveMetadata></lido:lido>\n"
+)
+
+
+def write_dump(path: Path, records: int, prologue: str = "") -> Path:
+    """Write a minimal LIDO dump with the given nodes before its root."""
+    path.write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        + prologue
+        + '<lido:lidoWrap xmlns:lido="http://www.lido-schema.org">\n'
+        + "".join(RECORD.format(i) for i in range(records))
+        + "</lido:lidoWrap>\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize(
+    "prologue",
+    [
+        "",
+        '<?xml-stylesheet type="text/xsl" href="lido.xsl"?>\n',
+        "<!-- exported from data.gov.ro -->\n",
+    ],
+)
+def test_parses_dump_with_nodes_before_root(tmp_path, prologue, workers):
+    dump = write_dump(tmp_path / "dump.xml", 120, prologue)
+
+    artworks = list(LIDOParser(dump, workers).iter_artworks())
+
+    assert [a["id"] for a in artworks] == [f"ro-{i:04d}" for i in range(120)]